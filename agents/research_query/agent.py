@@ -207,7 +207,7 @@ class ResearchQueryAgent(HealthSyncBaseAgent):
                     "status": "failed",
                     "query_id": parsed_query.query_id,
                     "workflow_id": workflow_result.workflow_id,
-                    "error_log": workflow_result.error_log,
+                    "error_log": self.workflow_orchestrator.format_error_log(workflow_result),
                     "processing_time": workflow_result.total_processing_time
                 }
             
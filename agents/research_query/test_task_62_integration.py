@@ -168,7 +168,15 @@ class TestTask62WorkflowOrchestration(unittest.TestCase):
         self.orchestrator._add_error_log(workflow, "TEST_ERROR", "Test error message")
         
         self.assertEqual(len(workflow.error_log), 1)
-        self.assertEqual(workflow.error_log[0]["error_code"], "TEST_ERROR")
+        error_log = self.orchestrator.format_error_log(workflow)
+        self.assertEqual(error_log[0]["error_code"], "TEST_ERROR")
+        self.assertEqual(error_log[0]["error_message"], "Test error message")
+        
+        # Error log construction can be disabled
+        self.orchestrator.error_log_enabled = False
+        self.orchestrator._add_error_log(workflow, "TEST_ERROR", "Suppressed error message")
+        self.assertEqual(len(workflow.error_log), 1)
+        self.orchestrator.error_log_enabled = True
         
         print("✓ Error escalation and logging working")
     
@@ -300,6 +308,155 @@ class TestTask62WorkflowOrchestration(unittest.TestCase):
         
         print("✓ Final dataset creation working")
     
+    def test_running_aggregates_track_step_completion(self):
+        """Test running aggregates are updated as steps complete."""
+        workflow = WorkflowExecution(
+            workflow_id="test-running-agg-workflow",
+            query_id="test-query",
+            researcher_id="HMS-12345",
+            status=WorkflowStatus.RUNNING
+        )
+        
+        consent_step = WorkflowStep(
+            step_id="consent-step",
+            step_name="Consent Check",
+            agent_role=AgentRole.CONSENT_AGENT,
+            status=WorkflowStatus.COMPLETED,
+            input_data={},
+            output_data={"consent_status": "granted"}
+        )
+        data_step = WorkflowStep(
+            step_id="data-step",
+            step_name="Data Retrieval",
+            agent_role=AgentRole.DATA_CUSTODIAN,
+            status=WorkflowStatus.COMPLETED,
+            input_data={},
+            output_data={"dataset_id": "DS-TEST123", "patient_count": 150, "data_fields": ["age", "gender"]}
+        )
+        workflow.steps = [consent_step, data_step]
+        
+        for step in workflow.steps:
+            self.orchestrator._record_step_completion(workflow, step)
+        
+        self.assertEqual(workflow.running_agg["granted_consents"], 1)
+        self.assertEqual(workflow.running_agg["total_patients"], 150)
+        self.assertEqual(workflow.running_agg["data_fields"], {"age", "gender"})
+        
+        data_summary = self.orchestrator._aggregate_data_results(workflow)
+        self.assertEqual(data_summary["total_patients"], 150)
+        self.assertEqual(len(data_summary["data_sources"]), 1)
+        
+        # Workflows assembled without step completion events are rebuilt on demand
+        rebuilt = WorkflowExecution(
+            workflow_id="test-rebuilt-workflow",
+            query_id="test-query",
+            researcher_id="HMS-12345",
+            status=WorkflowStatus.RUNNING,
+            steps=[consent_step, data_step]
+        )
+        self.orchestrator._ensure_running_agg(rebuilt)
+        self.assertEqual(rebuilt.running_agg["granted_consents"], 1)
+        self.assertEqual(rebuilt.running_agg["total_patients"], 150)
+
+    def test_running_aggregates_resync_with_completed_steps(self):
+        """Test aggregators rebuild running aggregates that miss completed steps."""
+        consent_step = WorkflowStep(
+            step_id="consent-step",
+            step_name="Consent Check",
+            agent_role=AgentRole.CONSENT_AGENT,
+            status=WorkflowStatus.COMPLETED,
+            input_data={},
+            output_data={"consent_status": "granted"}
+        )
+        data_steps = [
+            WorkflowStep(
+                step_id=f"data-step-{n}",
+                step_name="Data Retrieval",
+                agent_role=AgentRole.DATA_CUSTODIAN,
+                status=WorkflowStatus.COMPLETED,
+                input_data={},
+                output_data={"dataset_id": f"DS-{n}", "patient_count": 100, "data_fields": ["age"]}
+            )
+            for n in range(2)
+        ]
+        metta_step = WorkflowStep(
+            step_id="metta-step",
+            step_name="MeTTa Validation",
+            agent_role=AgentRole.METTA_AGENT,
+            status=WorkflowStatus.COMPLETED,
+            input_data={},
+            output_data={"validation_result": [{"passed": True}], "reasoning_path": [], "confidence_score": 0.8}
+        )
+
+        # Helpers work on workflows whose steps were filled in outside the orchestrator
+        workflow = WorkflowExecution(
+            workflow_id="test-unsynced-workflow",
+            query_id="test-query",
+            researcher_id="HMS-12345",
+            status=WorkflowStatus.RUNNING,
+            steps=[consent_step, *data_steps, metta_step]
+        )
+        self.assertEqual(self.orchestrator._aggregate_consent_results(workflow)["granted_consents"], 1)
+        self.assertEqual(self.orchestrator._aggregate_data_results(workflow)["total_patients"], 200)
+        self.assertEqual(self.orchestrator._aggregate_metta_results(workflow)["average_confidence"], 0.8)
+
+        # A step completed by other means after others were recorded is not lost
+        partial = WorkflowExecution(
+            workflow_id="test-partial-workflow",
+            query_id="test-query",
+            researcher_id="HMS-12345",
+            status=WorkflowStatus.RUNNING,
+            steps=[consent_step, *data_steps]
+        )
+        self.orchestrator._record_step_completion(partial, data_steps[0])
+        data_summary = self.orchestrator._aggregate_data_results(partial)
+        self.assertEqual(data_summary["total_patients"], 200)
+        self.assertEqual(len(data_summary["data_sources"]), 2)
+        self.assertEqual(self.orchestrator._aggregate_consent_results(partial)["granted_consents"], 1)
+
+    def test_running_aggregates_not_double_counted_on_retry(self):
+        """Test a step retried after a post-completion failure is aggregated once."""
+        workflow = WorkflowExecution(
+            workflow_id="test-retry-agg-workflow",
+            query_id="test-query",
+            researcher_id="HMS-12345",
+            status=WorkflowStatus.RUNNING
+        )
+        metta_step = WorkflowStep(
+            step_id="metta-step",
+            step_name="MeTTa Validation",
+            agent_role=AgentRole.METTA_AGENT,
+            status=WorkflowStatus.PENDING,
+            input_data={}
+        )
+        workflow.steps = [metta_step]
+        
+        self.orchestrator._send_and_wait = AsyncMock(return_value={
+            "success": True,
+            "results": [{"rule": "ethics", "passed": True}],
+            "reasoning_path": ["checked ethics"],
+            "confidence_score": 0.9
+        })
+        # The audit summary raises after the step is marked completed, forcing a retry
+        self.orchestrator._summarize_step_output = Mock(
+            side_effect=[Exception("audit summary failed"), {}]
+        )
+        
+        # Drive the step on a private loop so the main thread's event loop is left untouched
+        loop = asyncio.new_event_loop()
+        try:
+            with patch("agents.research_query.workflow_orchestrator.asyncio.sleep", new=AsyncMock()):
+                loop.run_until_complete(
+                    self.orchestrator._execute_workflow_step(Mock(), workflow, metta_step)
+                )
+        finally:
+            loop.close()
+        
+        self.assertEqual(metta_step.status, WorkflowStatus.COMPLETED)
+        self.assertEqual(metta_step.retry_count, 1)
+        self.assertEqual(workflow.running_agg["confidence_scores"], [0.9])
+        self.assertEqual(len(workflow.running_agg["validations"]), 1)
+    
     def test_requirement_4_4_workflow_logging_audit_trail(self):
         """Test Requirement 4.4: Workflow logging and audit trail generation."""
         print("\n=== Testing Requirement 4.4: Workflow Logging & Audit Trail ===")
@@ -336,15 +493,16 @@ class TestTask62WorkflowOrchestration(unittest.TestCase):
         for i, (expected_type, expected_details) in enumerate(test_events):
             entry = self.orchestrator.audit_trail[i]
             
-            self.assertEqual(entry["event_type"], expected_type)
-            self.assertEqual(entry["workflow_id"], workflow.workflow_id)
-            self.assertEqual(entry["query_id"], workflow.query_id)
-            self.assertEqual(entry["researcher_id"], workflow.researcher_id)
-            self.assertIn("timestamp", entry)
+            self.assertEqual(entry.event_type, expected_type)
+            self.assertEqual(entry.workflow_id, workflow.workflow_id)
+            self.assertEqual(entry.query_id, workflow.query_id)
+            self.assertEqual(entry.researcher_id, workflow.researcher_id)
+            self.assertIsInstance(entry.timestamp, float)
+            self.assertIn("timestamp", entry.to_dict())
             
             # Check details are included
             for key, value in expected_details.items():
-                self.assertEqual(entry["details"][key], value)
+                self.assertEqual(entry.details[key], value)
         
         print(f"✓ Audit trail logging: {len(test_events)} events recorded")
         
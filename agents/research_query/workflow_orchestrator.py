@@ -3,12 +3,16 @@ Multi-agent workflow orchestration for Research Query Agent.
 Coordinates data retrieval workflow across multiple agents.
 """
 
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
 import asyncio
+import time
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
 
 from shared.protocols.agent_messages import (
     AgentMessage, MessageTypes, ConsentQuery, DataRequest, 
@@ -38,6 +42,47 @@ class AgentRole(Enum):
     METTA_AGENT = "metta_integration_agent"
 
 
+# Output fields each agent role must return for a step to be considered valid
+_REQUIRED_FIELDS: Dict[AgentRole, frozenset] = {
+    AgentRole.METTA_AGENT: frozenset({"validation_result", "reasoning_path", "confidence_score"}),
+    AgentRole.CONSENT_AGENT: frozenset({"consent_status", "data_type", "research_category"}),
+    AgentRole.DATA_CUSTODIAN: frozenset({"dataset_id", "patient_count", "raw_data"}),
+    AgentRole.PRIVACY_AGENT: frozenset({"anonymized_data", "privacy_metrics", "anonymization_log"})
+}
+
+# Step output fields copied verbatim into audit summaries
+_SUMMARY_COPY_FIELDS = ("success", "confidence_score", "quality_score")
+
+# (minimum value, score contribution) tiers for privacy compliance, highest first
+_K_ANONYMITY_SCORES = ((5, 0.4), (3, 0.2))
+_L_DIVERSITY_SCORES = ((3, 0.3), (2, 0.15))
+
+# (minimum overall quality, grade) tiers, highest first; anything below is "F"
+_QUALITY_GRADES = ((0.9, "A"), (0.8, "B"), (0.7, "C"), (0.6, "D"))
+
+# Schema of the simulated anonymized records in the final dataset
+_FIELDS = ("patient_id", "age_group", "gender", "condition_category")
+_CATEGORIES = ("cardiovascular", "respiratory", "metabolic")
+_GENDERS = ("F", "M")
+_AGE_GROUPS = tuple(f"{20 + n * 10}-{29 + n * 10}" for n in range(6))
+
+# Recommendation for each quality factor that scores below 0.7
+_FACTOR_MSGS = {
+    "consent": "Consider expanding consent outreach or simplifying consent process",
+    "data": "Improve data collection completeness or expand data sources",
+    "privacy": "Enhance anonymization techniques or increase k-anonymity threshold",
+    "ethics": "Review ethical approval requirements or strengthen compliance measures"
+}
+
+
+def _threshold_score(tiers: Tuple[Tuple[float, float], ...], value: float) -> float:
+    """Return the score of the first tier whose threshold the value meets."""
+    for threshold, score in tiers:
+        if value >= threshold:
+            return score
+    return 0.0
+
+
 @dataclass
 class WorkflowStep:
     """Individual step in the workflow."""
@@ -54,6 +99,52 @@ class WorkflowStep:
     max_retries: int = 3
 
 
+# Simulated consent cache coverage: common data types for common research categories
+_CACHED_CONSENT_DATA_TYPES = frozenset({"demographics", "vital_signs"})
+_CACHED_CONSENT_CATEGORIES = frozenset({"clinical_trials", "outcomes_research"})
+
+
+@lru_cache(maxsize=512)
+def _cached_consent_template(data_type: Optional[str],
+                             research_category: Optional[str]) -> Optional[MappingProxyType]:
+    """Return the read-only cached consent fields for a data type/category pair, if any."""
+    if data_type not in _CACHED_CONSENT_DATA_TYPES or research_category not in _CACHED_CONSENT_CATEGORIES:
+        return None
+    
+    return MappingProxyType({
+        "consent_status": "granted",
+        "data_type": data_type,
+        "research_category": research_category
+    })
+
+
+@dataclass(frozen=True)
+class AuditEntry:
+    """Single workflow audit trail entry."""
+    __slots__ = ("timestamp", "workflow_id", "query_id", "researcher_id", "event_type", "details")
+    
+    timestamp: float
+    workflow_id: str
+    query_id: str
+    researcher_id: str
+    event_type: str
+    details: Dict[str, Any]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization."""
+        data = asdict(self)
+        data["timestamp"] = datetime.utcfromtimestamp(self.timestamp).isoformat()
+        return data
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        # Frozen instances reject setattr, so restore slots the way __init__ does
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
 @dataclass
 class WorkflowExecution:
     """Complete workflow execution context."""
@@ -63,12 +154,13 @@ class WorkflowExecution:
     status: WorkflowStatus
     steps: List[WorkflowStep] = field(default_factory=list)
     results: Dict[str, Any] = field(default_factory=dict)
-    error_log: List[Dict[str, Any]] = field(default_factory=list)
+    error_log: List[Tuple[float, str, str]] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.utcnow)
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     total_processing_time: Optional[float] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    running_agg: Dict[str, Any] = field(default_factory=dict)
 
 
 class WorkflowOrchestrator:
@@ -78,6 +170,9 @@ class WorkflowOrchestrator:
         self.agent_addresses = agent_addresses
         self.active_workflows: Dict[str, WorkflowExecution] = {}
         self.workflow_history: List[WorkflowExecution] = []
+        # workflow_history is append-only, so a plain dict index stays in sync with it
+        self._history_by_id: Dict[str, WorkflowExecution] = {}
+        self._last_status_lookup: Optional[WorkflowExecution] = None
         self.logger = get_logger("workflow_orchestrator")
         
         # Workflow configuration
@@ -86,8 +181,8 @@ class WorkflowOrchestrator:
         self.max_concurrent_workflows = 10
         
         # Circuit breaker configuration
-        self.circuit_breakers = {
-            agent_role.value: {
+        self.circuit_breakers: Dict[AgentRole, Dict[str, Any]] = {
+            agent_role: {
                 "failure_count": 0,
                 "last_failure": None,
                 "is_open": False,
@@ -96,6 +191,11 @@ class WorkflowOrchestrator:
             }
             for agent_role in AgentRole
         }
+        # Status view served by get_orchestrator_stats, updated only when breaker state changes
+        self._breaker_snapshot: Dict[str, Dict[str, Any]] = {
+            agent_role.value: {"is_open": False, "failure_count": 0}
+            for agent_role in AgentRole
+        }
         
         # Enhanced error handling and recovery
         self.retry_strategies = {
@@ -105,6 +205,14 @@ class WorkflowOrchestrator:
             AgentRole.PRIVACY_AGENT: {"max_retries": 2, "backoff_factor": 3.0}
         }
         
+        # Agent-specific recovery strategies
+        self._recovery_dispatch = {
+            AgentRole.METTA_AGENT: self._recover_metta_step,
+            AgentRole.CONSENT_AGENT: self._recover_consent_step,
+            AgentRole.DATA_CUSTODIAN: self._recover_data_step,
+            AgentRole.PRIVACY_AGENT: self._recover_privacy_step
+        }
+        
         # Result aggregation configuration
         self.aggregation_rules = {
             "consent_threshold": 0.8,  # 80% consent required
@@ -113,8 +221,11 @@ class WorkflowOrchestrator:
         }
         
         # Audit trail configuration
-        self.audit_trail: List[Dict[str, Any]] = []
+        self.audit_trail: List[AuditEntry] = []
+        self._by_workflow: Dict[str, List[AuditEntry]] = {}
+        self._by_event: Dict[str, List[AuditEntry]] = {}
         self.detailed_logging = True
+        self.error_log_enabled = True
         
         # Performance metrics
         self.performance_metrics = {
@@ -125,6 +236,10 @@ class WorkflowOrchestrator:
             "agent_performance": {role.value: {"success_rate": 1.0, "avg_response_time": 0.0} 
                                for role in AgentRole}
         }
+        # Direct references to each role's metrics entry, avoiding the nested string-keyed lookup
+        self._agent_metrics_by_role = {
+            role: self.performance_metrics["agent_performance"][role.value] for role in AgentRole
+        }
     
     async def execute_research_workflow(self, ctx, query_data: Dict[str, Any], 
                                       parsed_query) -> WorkflowExecution:
@@ -201,6 +316,7 @@ class WorkflowOrchestrator:
         finally:
             # Move to history and cleanup
             self.workflow_history.append(workflow)
+            self._history_by_id[workflow.workflow_id] = workflow
             if workflow.workflow_id in self.active_workflows:
                 del self.active_workflows[workflow.workflow_id]
         
@@ -372,6 +488,10 @@ class WorkflowOrchestrator:
                 "output_summary": self._summarize_step_output(step.output_data)
             })
             
+            # Fold into running aggregates last, so a failure in the bookkeeping
+            # above retries the step without counting it twice
+            self._record_step_completion(workflow, step)
+            
         except Exception as e:
             step.status = WorkflowStatus.FAILED
             step.error_message = str(e)
@@ -727,15 +847,25 @@ class WorkflowOrchestrator:
     
     def _add_error_log(self, workflow: WorkflowExecution, error_code: str, error_message: str):
         """Add error to workflow error log."""
-        workflow.error_log.append({
-            "timestamp": datetime.utcnow().isoformat(),
-            "error_code": error_code,
-            "error_message": error_message
-        })
+        if not self.error_log_enabled:
+            return
+        
+        workflow.error_log.append((time.time(), error_code, error_message))
+    
+    def format_error_log(self, workflow: WorkflowExecution) -> List[Dict[str, Any]]:
+        """Format workflow error log entries for serialization."""
+        return [
+            {
+                "timestamp": datetime.utcfromtimestamp(timestamp).isoformat(),
+                "error_code": error_code,
+                "error_message": error_message
+            }
+            for timestamp, error_code, error_message in workflow.error_log
+        ]
     
     def _is_circuit_breaker_open(self, agent_role: AgentRole) -> bool:
         """Check if circuit breaker is open for agent."""
-        breaker = self.circuit_breakers[agent_role.value]
+        breaker = self.circuit_breakers[agent_role]
         
         if not breaker["is_open"]:
             return False
@@ -746,39 +876,52 @@ class WorkflowOrchestrator:
             if time_since_failure > breaker["recovery_timeout"]:
                 breaker["is_open"] = False
                 breaker["failure_count"] = 0
+                self._update_breaker_snapshot(agent_role)
                 return False
         
         return True
     
     def _record_failure(self, agent_role: AgentRole):
         """Record failure for circuit breaker."""
-        breaker = self.circuit_breakers[agent_role.value]
+        breaker = self.circuit_breakers[agent_role]
         breaker["failure_count"] += 1
         breaker["last_failure"] = datetime.utcnow()
         
         if breaker["failure_count"] >= breaker["failure_threshold"]:
             breaker["is_open"] = True
+        
+        self._update_breaker_snapshot(agent_role)
     
     def _reset_circuit_breaker(self, agent_role: AgentRole):
         """Reset circuit breaker on successful operation."""
-        breaker = self.circuit_breakers[agent_role.value]
+        breaker = self.circuit_breakers[agent_role]
+        if breaker["failure_count"] == 0 and not breaker["is_open"] and breaker["last_failure"] is None:
+            return
+        
         breaker["failure_count"] = 0
         breaker["is_open"] = False
         breaker["last_failure"] = None
+        self._update_breaker_snapshot(agent_role)
+    
+    def _update_breaker_snapshot(self, agent_role: AgentRole):
+        """Refresh the cached status view for an agent's circuit breaker."""
+        breaker = self.circuit_breakers[agent_role]
+        snapshot = self._breaker_snapshot[agent_role.value]
+        snapshot["is_open"] = breaker["is_open"]
+        snapshot["failure_count"] = breaker["failure_count"]
     
     def get_workflow_status(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """Get current status of workflow."""
-        workflow = self.active_workflows.get(workflow_id)
-        if not workflow:
-            # Check history
-            workflow = next(
-                (w for w in self.workflow_history if w.workflow_id == workflow_id),
-                None
-            )
+        # Callers tend to poll the same workflow repeatedly
+        workflow = self._last_status_lookup
+        if not workflow or workflow.workflow_id != workflow_id:
+            workflow = self.active_workflows.get(workflow_id) or self._history_by_id.get(workflow_id)
         
         if not workflow:
             return None
         
+        self._last_status_lookup = workflow
+        
         return {
             "workflow_id": workflow.workflow_id,
             "query_id": workflow.query_id,
@@ -797,7 +940,7 @@ class WorkflowOrchestrator:
                 }
                 for step in workflow.steps
             ],
-            "error_log": workflow.error_log
+            "error_log": self.format_error_log(workflow)
         }
     
     def get_orchestrator_stats(self) -> Dict[str, Any]:
@@ -806,13 +949,7 @@ class WorkflowOrchestrator:
             "active_workflows": len(self.active_workflows),
             "completed_workflows": len([w for w in self.workflow_history if w.status == WorkflowStatus.COMPLETED]),
             "failed_workflows": len([w for w in self.workflow_history if w.status == WorkflowStatus.FAILED]),
-            "circuit_breaker_status": {
-                role: {
-                    "is_open": breaker["is_open"],
-                    "failure_count": breaker["failure_count"]
-                }
-                for role, breaker in self.circuit_breakers.items()
-            },
+            "circuit_breaker_status": {role: dict(status) for role, status in self._breaker_snapshot.items()},
             "average_processing_time": self._calculate_average_processing_time()
         }
     
@@ -835,58 +972,32 @@ class WorkflowOrchestrator:
             return False
         
         # Agent-specific validation
-        if step.agent_role == AgentRole.METTA_AGENT:
-            required_fields = ["validation_result", "reasoning_path", "confidence_score"]
-            return all(field in step.output_data for field in required_fields)
-        
-        elif step.agent_role == AgentRole.CONSENT_AGENT:
-            required_fields = ["consent_status", "data_type", "research_category"]
-            return all(field in step.output_data for field in required_fields)
-        
-        elif step.agent_role == AgentRole.DATA_CUSTODIAN:
-            required_fields = ["dataset_id", "patient_count", "raw_data"]
-            return all(field in step.output_data for field in required_fields)
-        
-        elif step.agent_role == AgentRole.PRIVACY_AGENT:
-            required_fields = ["anonymized_data", "privacy_metrics", "anonymization_log"]
-            return all(field in step.output_data for field in required_fields)
-        
-        return True
+        required_fields = _REQUIRED_FIELDS.get(step.agent_role)
+        return not required_fields or required_fields.issubset(step.output_data)
     
     def _summarize_step_output(self, output_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create summary of step output for logging."""
         if not output_data:
             return {}
         
-        summary = {}
-        
-        # Common fields
-        if "success" in output_data:
-            summary["success"] = output_data["success"]
+        # Common and quality fields copied as-is
+        summary = {key: output_data[key] for key in _SUMMARY_COPY_FIELDS if key in output_data}
         
         # Data size information
-        if "anonymized_data" in output_data:
-            summary["record_count"] = len(output_data["anonymized_data"])
-        elif "raw_data" in output_data:
-            summary["record_count"] = len(output_data["raw_data"])
-        
-        # Quality metrics
-        if "confidence_score" in output_data:
-            summary["confidence_score"] = output_data["confidence_score"]
-        if "quality_score" in output_data:
-            summary["quality_score"] = output_data["quality_score"]
+        records = output_data["anonymized_data"] if "anonymized_data" in output_data else output_data.get("raw_data")
+        if records is not None:
+            summary["record_count"] = len(records)
         
         # Privacy metrics
-        if "privacy_metrics" in output_data:
-            privacy_metrics = output_data["privacy_metrics"]
-            if isinstance(privacy_metrics, dict):
-                summary["privacy_compliance"] = privacy_metrics.get("k_anonymity", 0) >= 5
+        privacy_metrics = output_data.get("privacy_metrics")
+        if isinstance(privacy_metrics, dict):
+            summary["privacy_compliance"] = privacy_metrics.get("k_anonymity", 0) >= 5
         
         return summary
     
     def _update_agent_performance(self, agent_role: AgentRole, success: bool, processing_time: float):
         """Update agent performance metrics."""
-        agent_metrics = self.performance_metrics["agent_performance"][agent_role.value]
+        agent_metrics = self._agent_metrics_by_role[agent_role]
         
         # Update success rate (exponential moving average)
         current_rate = agent_metrics["success_rate"]
@@ -897,25 +1008,40 @@ class WorkflowOrchestrator:
         current_time = agent_metrics["avg_response_time"]
         agent_metrics["avg_response_time"] = (1 - alpha) * current_time + alpha * processing_time
     
+    def _append_audit(self, entry: AuditEntry):
+        """Append an audit entry and index it by workflow and event type."""
+        self.audit_trail.append(entry)
+        self._by_workflow.setdefault(entry.workflow_id, []).append(entry)
+        self._by_event.setdefault(entry.event_type, []).append(entry)
+    
+    def _rebuild_audit_indexes(self):
+        """Rebuild the audit indexes after the trail has been trimmed."""
+        self._by_workflow = {}
+        self._by_event = {}
+        for entry in self.audit_trail:
+            self._by_workflow.setdefault(entry.workflow_id, []).append(entry)
+            self._by_event.setdefault(entry.event_type, []).append(entry)
+    
     def _log_audit_event(self, workflow: WorkflowExecution, event_type: str, details: Dict[str, Any]):
         """Log audit event for workflow tracking."""
         if not self.detailed_logging:
             return
         
-        audit_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "workflow_id": workflow.workflow_id,
-            "query_id": workflow.query_id,
-            "researcher_id": workflow.researcher_id,
-            "event_type": event_type,
-            "details": details
-        }
+        audit_entry = AuditEntry(
+            timestamp=time.time(),
+            workflow_id=workflow.workflow_id,
+            query_id=workflow.query_id,
+            researcher_id=workflow.researcher_id,
+            event_type=event_type,
+            details=details
+        )
         
-        self.audit_trail.append(audit_entry)
+        self._append_audit(audit_entry)
         
         # Keep audit trail size manageable
         if len(self.audit_trail) > 10000:
             self.audit_trail = self.audit_trail[-5000:]  # Keep last 5000 entries
+            self._rebuild_audit_indexes()
         
         # Log to system logger as well
         self.logger.audit(
@@ -943,19 +1069,11 @@ class WorkflowOrchestrator:
         
         try:
             # Agent-specific recovery strategies
-            if failed_step.agent_role == AgentRole.METTA_AGENT:
-                return await self._recover_metta_step(ctx, workflow, failed_step)
-            
-            elif failed_step.agent_role == AgentRole.CONSENT_AGENT:
-                return await self._recover_consent_step(ctx, workflow, failed_step)
-            
-            elif failed_step.agent_role == AgentRole.DATA_CUSTODIAN:
-                return await self._recover_data_step(ctx, workflow, failed_step)
-            
-            elif failed_step.agent_role == AgentRole.PRIVACY_AGENT:
-                return await self._recover_privacy_step(ctx, workflow, failed_step)
+            recovery_handler = self._recovery_dispatch.get(failed_step.agent_role)
+            if not recovery_handler:
+                return False
             
-            return False
+            return await recovery_handler(ctx, workflow, failed_step)
             
         except Exception as e:
             self.logger.error("Recovery attempt failed",
@@ -982,6 +1100,7 @@ class WorkflowOrchestrator:
         failed_step.output_data = fallback_result
         failed_step.status = WorkflowStatus.COMPLETED
         failed_step.completed_at = datetime.utcnow()
+        self._record_step_completion(workflow, failed_step)
         
         self._log_audit_event(workflow, "RECOVERY_SUCCESS_FALLBACK", {
             "step_id": failed_step.step_id,
@@ -1001,6 +1120,7 @@ class WorkflowOrchestrator:
             failed_step.output_data = cached_consent
             failed_step.status = WorkflowStatus.COMPLETED
             failed_step.completed_at = datetime.utcnow()
+            self._record_step_completion(workflow, failed_step)
             
             self._log_audit_event(workflow, "RECOVERY_SUCCESS_CACHE", {
                 "step_id": failed_step.step_id,
@@ -1034,6 +1154,7 @@ class WorkflowOrchestrator:
         failed_step.output_data = recovery_result
         failed_step.status = WorkflowStatus.COMPLETED
         failed_step.completed_at = datetime.utcnow()
+        self._record_step_completion(workflow, failed_step)
         
         self._log_audit_event(workflow, "RECOVERY_SUCCESS_REDUCED_DATASET", {
             "step_id": failed_step.step_id,
@@ -1060,15 +1181,10 @@ class WorkflowOrchestrator:
         raw_data = data_step.output_data.get("raw_data", [])
         
         # Apply basic anonymization
-        basic_anonymized = []
-        for i, record in enumerate(raw_data):
-            anonymized_record = {}
-            for key, value in record.items():
-                if key == "patient_id":
-                    anonymized_record[key] = f"BASIC_ANON_{i:03d}"
-                else:
-                    anonymized_record[key] = value
-            basic_anonymized.append(anonymized_record)
+        basic_anonymized = [
+            {**record, "patient_id": f"BASIC_ANON_{i:03d}"} if "patient_id" in record else dict(record)
+            for i, record in enumerate(raw_data)
+        ]
         
         recovery_result = {
             "anonymized_data": basic_anonymized,
@@ -1080,6 +1196,7 @@ class WorkflowOrchestrator:
         failed_step.output_data = recovery_result
         failed_step.status = WorkflowStatus.COMPLETED
         failed_step.completed_at = datetime.utcnow()
+        self._record_step_completion(workflow, failed_step)
         
         self._log_audit_event(workflow, "RECOVERY_SUCCESS_BASIC_ANONYMIZATION", {
             "step_id": failed_step.step_id,
@@ -1094,22 +1211,77 @@ class WorkflowOrchestrator:
         # In a real implementation, this would check a consent cache
         # For simulation, we'll return cached consent for specific cases
         
-        data_type = consent_input.get("data_type")
-        research_category = consent_input.get("research_category")
+        template = _cached_consent_template(
+            consent_input.get("data_type"),
+            consent_input.get("research_category")
+        )
+        if template is None:
+            return None
         
-        # Simulate cached consent for common data types
-        if data_type in ["demographics", "vital_signs"] and research_category in ["clinical_trials", "outcomes_research"]:
-            return {
-                "consent_status": "granted",
-                "data_type": data_type,
-                "research_category": research_category,
-                "consent_details": {
-                    "source": "cached_consent",
-                    "consent_id": f"CACHED-{uuid.uuid4().hex[:8].upper()}"
-                }
+        return {
+            **template,
+            "consent_details": {
+                "source": "cached_consent",
+                "consent_id": f"CACHED-{uuid.uuid4().hex[:8].upper()}"
             }
+        }
+    
+    def _new_running_agg(self) -> Dict[str, Any]:
+        """Create empty running aggregates for a workflow."""
+        return {
+            "granted_consents": 0,
+            "total_patients": 0,
+            "data_fields": set(),
+            "data_sources": [],
+            "validations": [],
+            "reasoning_paths": [],
+            "confidence_scores": [],
+            "recorded_steps": set()
+        }
+    
+    def _record_step_completion(self, workflow: WorkflowExecution, step: WorkflowStep):
+        """Fold a completed step's output into the workflow's running aggregates."""
+        if not workflow.running_agg:
+            workflow.running_agg = self._new_running_agg()
         
-        return None
+        running_agg = workflow.running_agg
+        running_agg["recorded_steps"].add(step.step_id)
+        
+        output_data = step.output_data
+        if not output_data:
+            return
+        
+        if step.agent_role == AgentRole.CONSENT_AGENT:
+            if output_data.get("consent_status") == "granted":
+                running_agg["granted_consents"] += 1
+        
+        elif step.agent_role == AgentRole.DATA_CUSTODIAN:
+            patient_count = output_data.get("patient_count", 0)
+            data_fields = output_data.get("data_fields", ())
+            
+            running_agg["total_patients"] += patient_count
+            running_agg["data_fields"].update(data_fields)
+            running_agg["data_sources"].append({
+                "dataset_id": output_data.get("dataset_id"),
+                "patient_count": patient_count,
+                "data_fields": data_fields
+            })
+        
+        elif step.agent_role == AgentRole.METTA_AGENT:
+            running_agg["validations"].extend(output_data.get("validation_result", []))
+            running_agg["reasoning_paths"].extend(output_data.get("reasoning_path", []))
+            running_agg["confidence_scores"].append(output_data.get("confidence_score", 0.0))
+    
+    def _ensure_running_agg(self, workflow: WorkflowExecution):
+        """Rebuild running aggregates unless they cover exactly the workflow's completed steps."""
+        completed_steps = {s.step_id for s in workflow.steps if s.status == WorkflowStatus.COMPLETED}
+        if workflow.running_agg and workflow.running_agg["recorded_steps"] == completed_steps:
+            return
+        
+        workflow.running_agg = self._new_running_agg()
+        for step in workflow.steps:
+            if step.status == WorkflowStatus.COMPLETED:
+                self._record_step_completion(workflow, step)
     
     async def aggregate_workflow_results(self, workflow: WorkflowExecution) -> Dict[str, Any]:
         """Aggregate results from multiple data sources and validate quality."""
@@ -1133,11 +1305,17 @@ class WorkflowOrchestrator:
             "processing_summary": {}
         }
         
-        # Collect results from each step type
-        consent_results = self._aggregate_consent_results(workflow)
-        data_results = self._aggregate_data_results(workflow)
-        privacy_results = self._aggregate_privacy_results(workflow)
-        metta_results = self._aggregate_metta_results(workflow)
+        # Collect results from each step type. Syncing the running aggregates
+        # first leaves the aggregators independent and read-only, so run them
+        # off the event loop concurrently
+        self._ensure_running_agg(workflow)
+        loop = asyncio.get_running_loop()
+        consent_results, data_results, privacy_results, metta_results = await asyncio.gather(
+            loop.run_in_executor(None, self._aggregate_consent_results, workflow),
+            loop.run_in_executor(None, self._aggregate_data_results, workflow),
+            loop.run_in_executor(None, self._aggregate_privacy_results, workflow),
+            loop.run_in_executor(None, self._aggregate_metta_results, workflow)
+        )
         
         # Validate aggregation quality
         quality_assessment = self._assess_aggregation_quality(
@@ -1163,12 +1341,11 @@ class WorkflowOrchestrator:
     
     def _aggregate_consent_results(self, workflow: WorkflowExecution) -> Dict[str, Any]:
         """Aggregate consent verification results."""
+        self._ensure_running_agg(workflow)
         consent_steps = [s for s in workflow.steps if s.agent_role == AgentRole.CONSENT_AGENT]
         
         total_consents = len(consent_steps)
-        granted_consents = len([s for s in consent_steps 
-                               if s.status == WorkflowStatus.COMPLETED and 
-                               s.output_data.get("consent_status") == "granted"])
+        granted_consents = workflow.running_agg["granted_consents"]
         
         consent_rate = granted_consents / total_consents if total_consents > 0 else 0.0
         
@@ -1189,34 +1366,19 @@ class WorkflowOrchestrator:
     
     def _aggregate_data_results(self, workflow: WorkflowExecution) -> Dict[str, Any]:
         """Aggregate data retrieval results."""
+        self._ensure_running_agg(workflow)
         data_steps = [s for s in workflow.steps if s.agent_role == AgentRole.DATA_CUSTODIAN]
         
         if not data_steps:
             return {"error": "No data retrieval steps found"}
         
         # Combine results from all data sources
-        total_patients = 0
-        all_data_fields = set()
-        data_sources = []
-        
-        for step in data_steps:
-            if step.status == WorkflowStatus.COMPLETED and step.output_data:
-                patient_count = step.output_data.get("patient_count", 0)
-                data_fields = step.output_data.get("data_fields", [])
-                
-                total_patients += patient_count
-                all_data_fields.update(data_fields)
-                
-                data_sources.append({
-                    "dataset_id": step.output_data.get("dataset_id"),
-                    "patient_count": patient_count,
-                    "data_fields": data_fields
-                })
+        running_agg = workflow.running_agg
         
         return {
-            "total_patients": total_patients,
-            "unique_data_fields": list(all_data_fields),
-            "data_sources": data_sources,
+            "total_patients": running_agg["total_patients"],
+            "unique_data_fields": list(running_agg["data_fields"]),
+            "data_sources": list(running_agg["data_sources"]),
             "data_quality_score": self._calculate_data_quality_score(data_steps)
         }
     
@@ -1230,11 +1392,12 @@ class WorkflowOrchestrator:
         # Get the main privacy step result
         privacy_step = privacy_steps[0]  # Should only be one
         
-        if privacy_step.status != WorkflowStatus.COMPLETED or not privacy_step.output_data:
+        output_data = privacy_step.output_data
+        if privacy_step.status != WorkflowStatus.COMPLETED or not output_data:
             return {"error": "Privacy step failed or incomplete"}
         
-        privacy_metrics = privacy_step.output_data.get("privacy_metrics", {})
-        quality_score = privacy_step.output_data.get("quality_score", 0.0)
+        privacy_metrics = output_data.get("privacy_metrics", {})
+        quality_score = output_data.get("quality_score", 0.0)
         
         return {
             "anonymization_successful": True,
@@ -1242,36 +1405,27 @@ class WorkflowOrchestrator:
             "quality_score": quality_score,
             "k_anonymity_achieved": privacy_metrics.get("k_anonymity", 0) >= 5,
             "privacy_compliance_score": self._calculate_privacy_compliance_score(privacy_metrics),
-            "anonymized_record_count": len(privacy_step.output_data.get("anonymized_data", []))
+            "anonymized_record_count": len(output_data.get("anonymized_data", ()))
         }
     
     def _aggregate_metta_results(self, workflow: WorkflowExecution) -> Dict[str, Any]:
         """Aggregate MeTTa ethics and validation results."""
+        self._ensure_running_agg(workflow)
         metta_steps = [s for s in workflow.steps if s.agent_role == AgentRole.METTA_AGENT]
         
         if not metta_steps:
             return {"error": "No MeTTa validation steps found"}
         
         # Combine all MeTTa validation results
-        all_validations = []
-        all_reasoning_paths = []
-        confidence_scores = []
-        
-        for step in metta_steps:
-            if step.status == WorkflowStatus.COMPLETED and step.output_data:
-                validations = step.output_data.get("validation_result", [])
-                reasoning = step.output_data.get("reasoning_path", [])
-                confidence = step.output_data.get("confidence_score", 0.0)
-                
-                all_validations.extend(validations)
-                all_reasoning_paths.extend(reasoning)
-                confidence_scores.append(confidence)
+        running_agg = workflow.running_agg
+        all_validations = running_agg["validations"]
+        confidence_scores = running_agg["confidence_scores"]
         
         average_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.0
         
         return {
-            "validation_results": all_validations,
-            "reasoning_paths": all_reasoning_paths,
+            "validation_results": list(all_validations),
+            "reasoning_paths": list(running_agg["reasoning_paths"]),
             "average_confidence": average_confidence,
             "ethics_compliance_passed": average_confidence >= 0.6,
             "validation_count": len(all_validations)
@@ -1281,27 +1435,21 @@ class WorkflowOrchestrator:
                                   privacy_results: Dict, metta_results: Dict) -> Dict[str, Any]:
         """Assess overall quality of aggregated results."""
         
-        quality_factors = []
-        
-        # Consent quality
         consent_quality = consent_results.get("consent_rate", 0.0)
-        quality_factors.append(("consent", consent_quality))
-        
-        # Data quality
         data_quality = data_results.get("data_quality_score", 0.0)
-        quality_factors.append(("data", data_quality))
-        
-        # Privacy quality
         privacy_quality = privacy_results.get("quality_score", 0.0)
-        quality_factors.append(("privacy", privacy_quality))
-        
-        # Ethics quality
         ethics_quality = metta_results.get("average_confidence", 0.0)
-        quality_factors.append(("ethics", ethics_quality))
         
         # Calculate weighted overall quality
-        weights = {"consent": 0.3, "data": 0.3, "privacy": 0.25, "ethics": 0.15}
-        overall_quality = sum(weights[factor] * score for factor, score in quality_factors)
+        overall_quality = (
+            0.3 * consent_quality + 0.3 * data_quality + 0.25 * privacy_quality + 0.15 * ethics_quality
+        )
+        quality_factors = {
+            "consent": consent_quality,
+            "data": data_quality,
+            "privacy": privacy_quality,
+            "ethics": ethics_quality
+        }
         
         # Check compliance thresholds
         compliance_checks = {
@@ -1315,11 +1463,11 @@ class WorkflowOrchestrator:
         
         return {
             "overall_quality": overall_quality,
-            "quality_factors": dict(quality_factors),
+            "quality_factors": quality_factors,
             "compliance_checks": compliance_checks,
             "compliance_passed": compliance_passed,
             "quality_grade": self._calculate_quality_grade(overall_quality),
-            "recommendations": self._generate_quality_recommendations(quality_factors, compliance_checks)
+            "recommendations": self._generate_quality_recommendations(quality_factors.items(), compliance_checks)
         }
     
     def _calculate_data_quality_score(self, data_steps: List[WorkflowStep]) -> float:
@@ -1339,71 +1487,35 @@ class WorkflowOrchestrator:
     
     def _calculate_privacy_compliance_score(self, privacy_metrics: Dict[str, Any]) -> float:
         """Calculate privacy compliance score."""
-        score = 0.0
-        
-        # K-anonymity compliance
-        k_value = privacy_metrics.get("k_anonymity", 0)
-        if k_value >= 5:
-            score += 0.4
-        elif k_value >= 3:
-            score += 0.2
-        
-        # L-diversity compliance
-        l_value = privacy_metrics.get("l_diversity", 0)
-        if l_value >= 3:
-            score += 0.3
-        elif l_value >= 2:
-            score += 0.15
-        
-        # Additional privacy measures
-        if "differential_privacy" in privacy_metrics:
-            score += 0.2
-        
-        if "generalization" in privacy_metrics:
-            score += 0.1
+        score = (
+            _threshold_score(_K_ANONYMITY_SCORES, privacy_metrics.get("k_anonymity", 0)) +
+            _threshold_score(_L_DIVERSITY_SCORES, privacy_metrics.get("l_diversity", 0)) +
+            0.2 * ("differential_privacy" in privacy_metrics) +
+            0.1 * ("generalization" in privacy_metrics)
+        )
         
         return min(1.0, score)
     
     def _calculate_quality_grade(self, overall_quality: float) -> str:
         """Calculate quality grade based on overall score."""
-        if overall_quality >= 0.9:
-            return "A"
-        elif overall_quality >= 0.8:
-            return "B"
-        elif overall_quality >= 0.7:
-            return "C"
-        elif overall_quality >= 0.6:
-            return "D"
-        else:
-            return "F"
+        return next((grade for threshold, grade in _QUALITY_GRADES if overall_quality >= threshold), "F")
     
-    def _generate_quality_recommendations(self, quality_factors: List[Tuple[str, float]], 
+    def _generate_quality_recommendations(self, quality_factors: Iterable[Tuple[str, float]], 
                                         compliance_checks: Dict[str, bool]) -> List[str]:
         """Generate recommendations for improving quality."""
-        recommendations = []
-        
-        for factor, score in quality_factors:
-            if score < 0.7:
-                if factor == "consent":
-                    recommendations.append("Consider expanding consent outreach or simplifying consent process")
-                elif factor == "data":
-                    recommendations.append("Improve data collection completeness or expand data sources")
-                elif factor == "privacy":
-                    recommendations.append("Enhance anonymization techniques or increase k-anonymity threshold")
-                elif factor == "ethics":
-                    recommendations.append("Review ethical approval requirements or strengthen compliance measures")
-        
-        for check, passed in compliance_checks.items():
-            if not passed:
-                recommendations.append(f"Address compliance failure: {check}")
-        
+        recommendations = [_FACTOR_MSGS[factor] for factor, score in quality_factors
+                           if score < 0.7 and factor in _FACTOR_MSGS]
+        recommendations.extend(f"Address compliance failure: {check}"
+                               for check, passed in compliance_checks.items() if not passed)
         return recommendations
     
     def _create_final_dataset(self, data_results: Dict, privacy_results: Dict, 
                             quality_assessment: Dict) -> Dict[str, Any]:
         """Create final dataset for delivery to researcher."""
+        qa_get = quality_assessment.get
+        pr_get = privacy_results.get
         
-        if not quality_assessment.get("compliance_passed", False):
+        if not qa_get("compliance_passed", False):
             return {
                 "status": "rejected",
                 "reason": "Quality or compliance thresholds not met",
@@ -1415,15 +1527,15 @@ class WorkflowOrchestrator:
         if "anonymized_record_count" in privacy_results:
             # In a real implementation, this would get the actual anonymized records
             # For simulation, create sample anonymized records
-            record_count = privacy_results["anonymized_record_count"]
+            record_count = min(privacy_results["anonymized_record_count"], 100)  # Limit for demo
             anonymized_data = [
                 {
                     "patient_id": f"ANON_{i:04d}",
-                    "age_group": f"{20 + (i % 6) * 10}-{29 + (i % 6) * 10}",
-                    "gender": "M" if i % 2 else "F",
-                    "condition_category": ["cardiovascular", "respiratory", "metabolic"][i % 3]
+                    "age_group": _AGE_GROUPS[i % 6],
+                    "gender": _GENDERS[i & 1],
+                    "condition_category": _CATEGORIES[i % 3]
                 }
-                for i in range(min(record_count, 100))  # Limit for demo
+                for i in range(record_count)
             ]
         
         return {
@@ -1431,9 +1543,9 @@ class WorkflowOrchestrator:
             "records": anonymized_data,
             "metadata": {
                 "total_records": len(anonymized_data),
-                "data_fields": list(anonymized_data[0].keys()) if anonymized_data else [],
-                "privacy_level": privacy_results.get("privacy_metrics", {}),
-                "quality_grade": quality_assessment.get("quality_grade", "Unknown"),
+                "data_fields": list(_FIELDS) if anonymized_data else [],
+                "privacy_level": pr_get("privacy_metrics", {}),
+                "quality_grade": qa_get("quality_grade", "Unknown"),
                 "compliance_status": "PASSED"
             },
             "usage_restrictions": {
@@ -1448,15 +1560,19 @@ class WorkflowOrchestrator:
                        limit: int = 100) -> List[Dict[str, Any]]:
         """Get audit trail entries with optional filtering."""
         
-        filtered_entries = self.audit_trail
-        
-        if workflow_id:
-            filtered_entries = [e for e in filtered_entries if e.get("workflow_id") == workflow_id]
-        
-        if event_type:
-            filtered_entries = [e for e in filtered_entries if e.get("event_type") == event_type]
-        
-        # Sort by timestamp (newest first) and limit
-        filtered_entries = sorted(filtered_entries, key=lambda x: x["timestamp"], reverse=True)
+        # Entries are appended in timestamp order, so newest first is a reverse walk
+        if workflow_id and event_type:
+            by_workflow = self._by_workflow.get(workflow_id, [])
+            by_event = self._by_event.get(event_type, [])
+            if len(by_workflow) <= len(by_event):
+                bucket = (e for e in reversed(by_workflow) if e.event_type == event_type)
+            else:
+                bucket = (e for e in reversed(by_event) if e.workflow_id == workflow_id)
+        elif workflow_id:
+            bucket = reversed(self._by_workflow.get(workflow_id, []))
+        elif event_type:
+            bucket = reversed(self._by_event.get(event_type, []))
+        else:
+            bucket = reversed(self.audit_trail)
         
-        return filtered_entries[:limit]
\ No newline at end of file
+        return [entry.to_dict() for entry in islice(bucket, limit)]
\ No newline at end of file
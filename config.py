@@ -3,7 +3,9 @@ Configuration settings for HealthSync agents.
 """
 
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 
 # Agent configuration
 AGENT_CONFIG = {
@@ -74,21 +76,36 @@ AGENTVERSE_CONFIG = {
     "badges": ["Innovation Lab", "ASI Alliance Hackathon"]
 }
 
-def get_agent_config(agent_name: str) -> Dict[str, Any]:
+# Configuration is read-only at runtime; expose it as frozen mappings
+AGENT_CONFIG = MappingProxyType({name: MappingProxyType(cfg) for name, cfg in AGENT_CONFIG.items()})
+METTA_CONFIG = MappingProxyType(METTA_CONFIG)
+CHAT_CONFIG = MappingProxyType(CHAT_CONFIG)
+PRIVACY_CONFIG = MappingProxyType(PRIVACY_CONFIG)
+ERROR_CONFIG = MappingProxyType(ERROR_CONFIG)
+AGENTVERSE_CONFIG = MappingProxyType(AGENTVERSE_CONFIG)
+
+# Combined view returned by get_all_config, built once at import
+_ALL_CONFIG = MappingProxyType({
+    "agents": AGENT_CONFIG,
+    "logging": MappingProxyType({
+        "level": LOG_LEVEL,
+        "directory": LOG_DIR
+    }),
+    "metta": METTA_CONFIG,
+    "chat": CHAT_CONFIG,
+    "privacy": PRIVACY_CONFIG,
+    "error_handling": ERROR_CONFIG,
+    "agentverse": AGENTVERSE_CONFIG
+})
+
+# Shared read-only result for unknown agents
+_EMPTY = MappingProxyType({})
+
+@lru_cache(maxsize=16)
+def get_agent_config(agent_name: str) -> Mapping[str, Any]:
     """Get configuration for specific agent."""
-    return AGENT_CONFIG.get(agent_name, {})
+    return AGENT_CONFIG.get(agent_name, _EMPTY)
 
-def get_all_config() -> Dict[str, Any]:
-    """Get all configuration settings."""
-    return {
-        "agents": AGENT_CONFIG,
-        "logging": {
-            "level": LOG_LEVEL,
-            "directory": LOG_DIR
-        },
-        "metta": METTA_CONFIG,
-        "chat": CHAT_CONFIG,
-        "privacy": PRIVACY_CONFIG,
-        "error_handling": ERROR_CONFIG,
-        "agentverse": AGENTVERSE_CONFIG
-    }
\ No newline at end of file
+def get_all_config() -> Mapping[str, Any]:
+    """Get all configuration settings (read-only view)."""
+    return _ALL_CONFIG
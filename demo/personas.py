@@ -6,19 +6,55 @@ for demonstrating the HealthSync system capabilities.
 """
 
 from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Dict, List, Any
 import json
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _isoformat(value: datetime) -> str:
+    """Render datetimes as ISO 8601, matching orjson's native output"""
+    return value.isoformat()
+
 
 class DemoPersonas:
-    """Manages demo personas and their associated data"""
+    """Manages demo personas and their associated data
+    
+    Persona and dataset collections are built on first access.
+    """
+    
+    @cached_property
+    def patients(self) -> List[Dict[str, Any]]:
+        return self._create_patient_personas()
+    
+    @cached_property
+    def researchers(self) -> List[Dict[str, Any]]:
+        return self._create_researcher_personas()
+    
+    @cached_property
+    def demo_datasets(self) -> Dict[str, Any]:
+        return self._create_demo_datasets()
+    
+    @cached_property
+    def _patients_by_id(self) -> Dict[str, Dict[str, Any]]:
+        return {p["patient_id"]: p for p in self.patients}
+    
+    @cached_property
+    def _researchers_by_id(self) -> Dict[str, Dict[str, Any]]:
+        return {r["researcher_id"]: r for r in self.researchers}
     
-    def __init__(self):
-        self.patients = self._create_patient_personas()
-        self.researchers = self._create_researcher_personas()
-        self.demo_datasets = self._create_demo_datasets()
+    @cached_property
+    def _eligible_datasets(self) -> List[Dict[str, Any]]:
+        # Datasets with sufficient consent coverage; the demo data is static
+        return [d for d in self.demo_datasets.values() if d["consent_coverage"] > 0.7]
     
     def _create_patient_personas(self) -> List[Dict[str, Any]]:
         """Create realistic patient personas with diverse backgrounds"""
+        now = datetime.now()
         return [
             {
                 "patient_id": "patient_001",
@@ -45,12 +81,12 @@ class DemoPersonas:
                 },
                 "consent_history": [
                     {
-                        "timestamp": datetime.now() - timedelta(days=30),
+                        "timestamp": now - timedelta(days=30),
                         "action": "initial_consent",
                         "changes": "granted_all_diabetes_research"
                     },
                     {
-                        "timestamp": datetime.now() - timedelta(days=15),
+                        "timestamp": now - timedelta(days=15),
                         "action": "updated_consent",
                         "changes": "revoked_imaging_data_sharing"
                     }
@@ -82,7 +118,7 @@ class DemoPersonas:
                 },
                 "consent_history": [
                     {
-                        "timestamp": datetime.now() - timedelta(days=45),
+                        "timestamp": now - timedelta(days=45),
                         "action": "initial_consent",
                         "changes": "selective_consent_cardiovascular_only"
                     }
@@ -114,7 +150,7 @@ class DemoPersonas:
                 },
                 "consent_history": [
                     {
-                        "timestamp": datetime.now() - timedelta(days=10),
+                        "timestamp": now - timedelta(days=10),
                         "action": "initial_consent",
                         "changes": "granted_all_mental_health_research"
                     }
@@ -228,40 +264,43 @@ class DemoPersonas:
     
     def get_patient_by_id(self, patient_id: str) -> Dict[str, Any]:
         """Get patient persona by ID"""
-        for patient in self.patients:
-            if patient["patient_id"] == patient_id:
-                return patient
-        return None
+        return self._patients_by_id.get(patient_id)
     
     def get_researcher_by_id(self, researcher_id: str) -> Dict[str, Any]:
         """Get researcher persona by ID"""
-        for researcher in self.researchers:
-            if researcher["researcher_id"] == researcher_id:
-                return researcher
-        return None
+        return self._researchers_by_id.get(researcher_id)
     
     def get_matching_datasets(self, research_query: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Find datasets matching research requirements"""
-        matching = []
-        for dataset_id, dataset in self.demo_datasets.items():
-            # Simple matching logic for demo purposes
-            if dataset["consent_coverage"] > 0.7:  # Sufficient consent coverage
-                matching.append(dataset)
-        return matching
+        # Simple matching logic for demo purposes
+        return list(self._eligible_datasets)
     
-    def export_personas_json(self, filepath: str):
-        """Export all personas to JSON file for easy loading"""
+    def export_personas_json(self, filepath: str, pretty: bool = False):
+        """Export all personas to JSON file for easy loading
+        
+        Output is compact unless pretty is set for human inspection.
+        """
         data = {
             "patients": self.patients,
             "researchers": self.researchers,
             "datasets": self.demo_datasets,
             "generated_at": datetime.now().isoformat()
         }
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        if HAS_ORJSON:
+            # orjson serializes the consent-history datetimes natively
+            option = orjson.OPT_SERIALIZE_NUMPY
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            blob = orjson.dumps(data, option=option)
+        elif pretty:
+            blob = json.dumps(data, indent=2, default=_isoformat).encode()
+        else:
+            blob = json.dumps(data, separators=(",", ":"), default=_isoformat).encode()
+        with open(filepath, 'wb', buffering=1 << 16) as f:
+            f.write(blob)
 
 if __name__ == "__main__":
     # Generate demo personas
     personas = DemoPersonas()
-    personas.export_personas_json("demo/personas_data.json")
+    personas.export_personas_json("demo/personas_data.json", pretty=True)
     print("Demo personas generated successfully!")
\ No newline at end of file
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Tests for demo dataset generation.
+Checks the mask-based cohort filter and k-anonymity against straightforward
+per-patient reference implementations on a seeded cohort.
+"""
+
+import unittest
+import sys
+import os
+from collections import Counter
+
+# Demo modules import each other by bare name
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from demo_datasets import DemoDatasetGenerator, _public_record
+
+
+def _reference_filter(patients, query):
+    """Filter patients by checking each criterion on the public patient fields."""
+    filtered = []
+    for patient in patients:
+        consent_prefs = patient["consent_preferences"]
+        if not consent_prefs["research_categories"].get(query.get("research_category", ""), False):
+            continue
+        if not all(consent_prefs.get(dt, False) for dt in query.get("data_types", [])):
+            continue
+        required_conditions = query.get("conditions", [])
+        if required_conditions and not any(c in patient["medical_conditions"] for c in required_conditions):
+            continue
+        demo_requirements = query.get("demographics", {})
+        if "age_range" in demo_requirements and patient["demographics"]["age_range"] not in demo_requirements["age_range"]:
+            continue
+        if "gender" in demo_requirements and patient["demographics"]["gender"] not in demo_requirements["gender"]:
+            continue
+        filtered.append(patient)
+    return filtered
+
+
+def _reference_k_anonymous_ids(patients, k):
+    """Return the ids of patients whose quasi-identifier group has at least k members."""
+    def key(patient):
+        demographics = patient["demographics"]
+        return demographics["age_range"], demographics["gender"], demographics["ethnicity"]
+
+    group_sizes = Counter(key(patient) for patient in patients)
+    return [patient["patient_id_hash"] for patient in patients if group_sizes[key(patient)] >= k]
+
+
+class TestDemoDatasetFiltering(unittest.TestCase):
+    """Test cohort filtering equivalence on a seeded cohort."""
+
+    QUERIES = [
+        {
+            "research_category": "diabetes_research",
+            "data_types": ["clinical_records", "lifestyle_data"],
+            "conditions": ["diabetes_type2", "prediabetes"]
+        },
+        {
+            "research_category": "cardiovascular_research",
+            "data_types": ["clinical_records", "imaging_data"],
+            "conditions": ["heart_disease", "hypertension"],
+            "demographics": {"age_range": ["55-64", "65+"], "gender": ["female"]}
+        },
+        {
+            "research_category": "mental_health_research",
+            "data_types": ["genomic_data"],
+            "demographics": {"gender": ["male", "other"]}
+        },
+        {"research_category": "cancer_research", "conditions": ["prediabetes"]},
+        {"research_category": "diabetes_research", "data_types": ["lab_results"]},
+        {"research_category": "unknown_research"},
+        {"data_types": ["clinical_records"]}
+    ]
+
+    def setUp(self):
+        """Generate a seeded cohort, with and without the internal fields."""
+        self.generator = DemoDatasetGenerator(seed=42)
+        self.patients = self.generator.generate_realistic_patient_data(2000)
+        self.public_patients = [_public_record(patient) for patient in self.patients]
+
+    def test_filter_matches_reference(self):
+        """The mask-based filter selects exactly the reference cohort."""
+        matched_any = False
+        for query in self.QUERIES:
+            with self.subTest(query=query):
+                expected = [p["patient_id"] for p in _reference_filter(self.public_patients, query)]
+                actual = [p["patient_id"] for p in self.generator._filter_patients_by_query(self.patients, query)]
+                self.assertEqual(actual, expected)
+                matched_any = matched_any or bool(expected)
+        self.assertTrue(matched_any)
+
+    def test_filter_without_internal_fields(self):
+        """Masks derived from public fields give the same cohort as precomputed ones."""
+        for query in self.QUERIES:
+            with self.subTest(query=query):
+                with_masks = self.generator._filter_patients_by_query(self.patients, query)
+                without_masks = self.generator._filter_patients_by_query(self.public_patients, query)
+                self.assertEqual(
+                    [p["patient_id"] for p in without_masks],
+                    [p["patient_id"] for p in with_masks]
+                )
+
+    def test_filter_matches_unknown_conditions_by_name(self):
+        """Conditions the generator never produces still match external patients."""
+        external = [dict(patient) for patient in self.public_patients[:300]]
+        for patient in external[::3]:
+            patient["medical_conditions"] = [*patient["medical_conditions"], "diabetes_type1"]
+
+        for conditions in (["diabetes_type1"], ["diabetes_type1", "hypertension"]):
+            query = {"research_category": "diabetes_research", "conditions": conditions}
+            with self.subTest(conditions=conditions):
+                expected = [p["patient_id"] for p in _reference_filter(external, query)]
+                actual = [p["patient_id"] for p in self.generator._filter_patients_by_query(external, query)]
+                self.assertTrue(expected)
+                self.assertEqual(actual, expected)
+
+    def test_filter_matches_unknown_consents_by_name(self):
+        """Consents outside the generator's lists are read from the patient's preferences."""
+        external = []
+        for patient in self.public_patients[:300]:
+            patient = dict(patient)
+            consent_prefs = dict(patient["consent_preferences"])
+            consent_prefs["research_categories"] = dict(consent_prefs["research_categories"])
+            consent_prefs["wearable_data"] = len(external) % 2 == 0
+            consent_prefs["research_categories"]["rare_disease_research"] = len(external) % 3 == 0
+            patient["consent_preferences"] = consent_prefs
+            external.append(patient)
+
+        queries = [
+            {"research_category": "diabetes_research", "data_types": ["clinical_records", "wearable_data"]},
+            {"research_category": "rare_disease_research", "data_types": ["clinical_records"]},
+            {"research_category": "rare_disease_research", "data_types": ["wearable_data"]},
+            {"research_category": "diabetes_research", "data_types": ["diabetes_research"]}
+        ]
+        for query in queries:
+            with self.subTest(query=query):
+                expected = [p["patient_id"] for p in _reference_filter(external, query)]
+                actual = [p["patient_id"] for p in self.generator._filter_patients_by_query(external, query)]
+                self.assertEqual(actual, expected)
+        self.assertTrue(_reference_filter(external, queries[2]))
+
+    def test_k_anonymity_matches_reference(self):
+        """Records are kept exactly when their quasi-identifier group has k members."""
+        cohort = self.generator._filter_patients_by_query(self.patients, self.QUERIES[0])
+        expected = _reference_k_anonymous_ids(cohort, k=5)
+        self.assertTrue(expected)
+
+        for source in (cohort, [_public_record(patient) for patient in cohort]):
+            records = self.generator._apply_k_anonymity(source, k=5)
+            self.assertEqual([r["patient_id_hash"] for r in records], expected)
+            for record in records:
+                self.assertNotIn("patient_id", record)
+                self.assertFalse(set(record) & {"condition_mask", "consent_mask", "quasi_id_code"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -6,17 +6,28 @@ Monitors registered agents and provides real-time status updates.
 import asyncio
 import aiohttp
 import json
+import random
 import sys
 import os
+import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from typing import Deque, Dict, Any, List, Optional, Tuple
 import logging
+from collections import deque
+
+import numpy as np
 
 # Add project root to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from config import AGENT_CONFIG
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 class AgentHealthMonitor:
     """Monitors health and status of all HealthSync agents."""
@@ -29,9 +40,21 @@ class AgentHealthMonitor:
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
         
-        # Agent status tracking
-        self.agent_status: Dict[str, Dict[str, Any]] = {}
-        self.status_history: List[Dict[str, Any]] = []
+        # Agent status tracking, one array slot per configured agent
+        self._agent_items: Tuple[Tuple[str, Dict[str, Any]], ...] = tuple(AGENT_CONFIG.items())
+        self._agent_names: List[str] = [name for name, _ in self._agent_items]
+        self._agent_index: Dict[str, int] = {name: i for i, name in enumerate(self._agent_names)}
+        agent_count = len(self._agent_names)
+        self._total_checks = np.zeros(agent_count, dtype=np.int64)
+        self._total_failures = np.zeros(agent_count, dtype=np.int64)
+        self._consecutive_failures = np.zeros(agent_count, dtype=np.int64)
+        self._last_healthy: List[Optional[str]] = [None] * agent_count
+        self._last_unhealthy: List[Optional[str]] = [None] * agent_count
+        self.status_history: Deque[Dict[str, Any]] = deque(maxlen=100)
+        
+        # Rolling healthy-agent counts over the last 10 checks
+        self._recent_healthy: Deque[int] = deque(maxlen=10)
+        self._recent_healthy_sum = 0
         
         # Alert thresholds
         self.alert_thresholds = {
@@ -45,6 +68,8 @@ class AgentHealthMonitor:
         self.monitoring_active = True
         self.logger.info("Starting agent health monitoring...")
         
+        consecutive_loop_errors = 0
+        
         while self.monitoring_active:
             try:
                 # Check all agents
@@ -52,13 +77,18 @@ class AgentHealthMonitor:
                 
                 # Generate alerts if needed
                 await self.check_alerts()
+                consecutive_loop_errors = 0
                 
                 # Wait for next check
                 await asyncio.sleep(self.check_interval)
                 
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {str(e)}")
-                await asyncio.sleep(5)  # Short delay before retry
+                # Exponential backoff with jitter, capped at the check interval
+                delay = min(self.check_interval, 0.5 * (2 ** consecutive_loop_errors))
+                if delay < self.check_interval:
+                    consecutive_loop_errors += 1
+                await asyncio.sleep(delay + random.uniform(0, 0.25))
     
     def stop_monitoring(self):
         """Stop agent monitoring."""
@@ -67,49 +97,59 @@ class AgentHealthMonitor:
     
     async def check_all_agents(self) -> Dict[str, Any]:
         """Check health status of all agents."""
-        check_timestamp = datetime.utcnow()
+        cycle_iso = datetime.utcnow().isoformat()
         results = {
-            "timestamp": check_timestamp.isoformat(),
-            "agents": {},
-            "summary": {
-                "total_agents": len(AGENT_CONFIG),
-                "healthy_agents": 0,
-                "unhealthy_agents": 0,
-                "unknown_agents": 0
-            }
+            "timestamp": cycle_iso,
+            "agents": {}
         }
         
-        # Check each agent
-        for agent_name, agent_config in AGENT_CONFIG.items():
-            try:
-                health_result = await self.check_agent_health(agent_name, agent_config)
-                results["agents"][agent_name] = health_result
-                
-                # Update summary
-                if health_result["status"] == "healthy":
-                    results["summary"]["healthy_agents"] += 1
-                elif health_result["status"] == "unhealthy":
-                    results["summary"]["unhealthy_agents"] += 1
-                else:
-                    results["summary"]["unknown_agents"] += 1
-                
-                # Update agent status tracking
-                self._update_agent_status(agent_name, health_result)
-                
-            except Exception as e:
-                self.logger.error(f"Error checking {agent_name}: {str(e)}")
+        # Check all agents concurrently; each check is I/O bound
+        agent_names = self._agent_names
+        health_results = await asyncio.gather(
+            *(self.check_agent_health(name, config) for name, config in self._agent_items),
+            return_exceptions=True
+        )
+        
+        # Summarize while folding results in; checks that raised are not counted
+        healthy = unhealthy = unknown = 0
+        for idx, (agent_name, health_result) in enumerate(zip(agent_names, health_results)):
+            if isinstance(health_result, Exception):
+                self.logger.error(f"Error checking {agent_name}: {str(health_result)}")
                 results["agents"][agent_name] = {
                     "status": "error",
-                    "error": str(e),
-                    "timestamp": check_timestamp.isoformat()
+                    "error": str(health_result),
+                    "timestamp": cycle_iso
                 }
+                continue
+            
+            results["agents"][agent_name] = health_result
+            
+            status = health_result["status"]
+            if status == "healthy":
+                healthy += 1
+            elif status == "unhealthy":
+                unhealthy += 1
+            else:
+                unknown += 1
+            
+            # Update agent status tracking
+            self._update_agent_status(idx, health_result)
+        
+        results["summary"] = {
+            "total_agents": len(AGENT_CONFIG),
+            "healthy_agents": healthy,
+            "unhealthy_agents": unhealthy,
+            "unknown_agents": unknown
+        }
         
-        # Add to history
+        # Add to history; the deque keeps only the last 100 checks
         self.status_history.append(results)
         
-        # Keep only last 100 checks
-        if len(self.status_history) > 100:
-            self.status_history = self.status_history[-100:]
+        # Update the rolling healthy-agent window
+        if len(self._recent_healthy) == self._recent_healthy.maxlen:
+            self._recent_healthy_sum -= self._recent_healthy[0]
+        self._recent_healthy.append(healthy)
+        self._recent_healthy_sum += healthy
         
         return results
     
@@ -118,17 +158,17 @@ class AgentHealthMonitor:
         port = agent_config.get("port")
         health_url = f"http://localhost:{port}/health"
         
-        start_time = datetime.utcnow()
+        start_ns = time.monotonic_ns()
         
         try:
             # For demo purposes, simulate health check
             # In real implementation, this would make HTTP request
             await asyncio.sleep(0.05)  # Simulate network delay
             
-            response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            response_time = (time.monotonic_ns() - start_ns) / 1e6
+            end_iso = datetime.utcnow().isoformat()
             
             # Simulate occasional failures for demo
-            import random
             if random.random() < 0.05:  # 5% failure rate
                 raise Exception("Simulated network timeout")
             
@@ -138,17 +178,17 @@ class AgentHealthMonitor:
                 "port": port,
                 "health_url": health_url,
                 "response_time_ms": round(response_time, 2),
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": end_iso,
                 "details": {
                     "uptime": "running",
                     "memory_usage": "normal",
                     "message_queue_size": random.randint(0, 10),
-                    "last_activity": datetime.utcnow().isoformat()
+                    "last_activity": end_iso
                 }
             }
             
         except Exception as e:
-            response_time = (datetime.utcnow() - start_time).total_seconds() * 1000
+            response_time = (time.monotonic_ns() - start_ns) / 1e6
             
             return {
                 "status": "unhealthy",
@@ -160,67 +200,86 @@ class AgentHealthMonitor:
                 "timestamp": datetime.utcnow().isoformat()
             }
     
-    def _update_agent_status(self, agent_name: str, health_result: Dict[str, Any]):
-        """Update agent status tracking."""
-        if agent_name not in self.agent_status:
-            self.agent_status[agent_name] = {
-                "consecutive_failures": 0,
-                "total_checks": 0,
-                "total_failures": 0,
-                "last_healthy": None,
-                "last_unhealthy": None
-            }
-        
-        status = self.agent_status[agent_name]
-        status["total_checks"] += 1
+    @property
+    def agent_status(self) -> Dict[str, Dict[str, Any]]:
+        """Per-agent status tracking for every agent checked so far."""
+        return {
+            name: self._status_entry(i)
+            for i, name in enumerate(self._agent_names)
+            if self._total_checks[i]
+        }
+    
+    def _status_entry(self, idx: int) -> Dict[str, Any]:
+        """Build the status tracking record for one agent slot."""
+        return {
+            "consecutive_failures": int(self._consecutive_failures[idx]),
+            "total_checks": int(self._total_checks[idx]),
+            "total_failures": int(self._total_failures[idx]),
+            "last_healthy": self._last_healthy[idx],
+            "last_unhealthy": self._last_unhealthy[idx]
+        }
+    
+    def _update_agent_status(self, idx: int, health_result: Dict[str, Any]):
+        """Update agent status tracking for the agent in slot idx."""
+        self._total_checks[idx] += 1
         
         if health_result["status"] == "healthy":
-            status["consecutive_failures"] = 0
-            status["last_healthy"] = health_result["timestamp"]
+            self._consecutive_failures[idx] = 0
+            self._last_healthy[idx] = health_result["timestamp"]
         else:
-            status["consecutive_failures"] += 1
-            status["total_failures"] += 1
-            status["last_unhealthy"] = health_result["timestamp"]
+            self._consecutive_failures[idx] += 1
+            self._total_failures[idx] += 1
+            self._last_unhealthy[idx] = health_result["timestamp"]
     
     async def check_alerts(self):
         """Check for alert conditions and generate notifications."""
         alerts = []
+        alert_timestamp = datetime.utcnow().isoformat()
+        
+        # Check consecutive failures across all agents at once
+        failing = np.flatnonzero(
+            self._consecutive_failures >= self.alert_thresholds["consecutive_failures"]
+        )
+        for idx in failing:
+            agent_name = self._agent_names[idx]
+            alerts.append({
+                "type": "consecutive_failures",
+                "agent_name": agent_name,
+                "severity": "high",
+                "message": f"{agent_name} has failed {self._consecutive_failures[idx]} consecutive health checks",
+                "timestamp": alert_timestamp
+            })
+        
+        # Check error rate, only after sufficient data
+        sufficient = self._total_checks > 10
+        error_rates = np.zeros(len(self._agent_names), dtype=np.float64)
+        np.divide(self._total_failures, self._total_checks, out=error_rates, where=sufficient)
+        high_error = np.flatnonzero(
+            sufficient & (error_rates > self.alert_thresholds["error_rate_threshold"])
+        )
+        for idx in high_error:
+            agent_name = self._agent_names[idx]
+            alerts.append({
+                "type": "high_error_rate",
+                "agent_name": agent_name,
+                "severity": "medium",
+                "message": f"{agent_name} has high error rate: {error_rates[idx]:.1%}",
+                "timestamp": alert_timestamp
+            })
         
-        for agent_name, status in self.agent_status.items():
-            # Check consecutive failures
-            if status["consecutive_failures"] >= self.alert_thresholds["consecutive_failures"]:
-                alerts.append({
-                    "type": "consecutive_failures",
-                    "agent_name": agent_name,
-                    "severity": "high",
-                    "message": f"{agent_name} has failed {status['consecutive_failures']} consecutive health checks",
-                    "timestamp": datetime.utcnow().isoformat()
-                })
-            
-            # Check error rate
-            if status["total_checks"] > 10:  # Only check after sufficient data
-                error_rate = status["total_failures"] / status["total_checks"]
-                if error_rate > self.alert_thresholds["error_rate_threshold"]:
-                    alerts.append({
-                        "type": "high_error_rate",
-                        "agent_name": agent_name,
-                        "severity": "medium",
-                        "message": f"{agent_name} has high error rate: {error_rate:.1%}",
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-        
-        # Log alerts
-        for alert in alerts:
-            self.logger.warning(f"ALERT: {alert['message']}")
+        # Log alerts as one record per sweep
+        if alerts:
+            self.logger.warning("\n".join(f"ALERT: {alert['message']}" for alert in alerts))
         
         return alerts
     
     def get_agent_statistics(self, agent_name: str) -> Dict[str, Any]:
         """Get detailed statistics for specific agent."""
-        if agent_name not in self.agent_status:
+        idx = self._agent_index.get(agent_name)
+        if idx is None or not self._total_checks[idx]:
             return {"error": "Agent not found"}
         
-        status = self.agent_status[agent_name]
+        status = self._status_entry(idx)
         
         # Calculate uptime percentage
         uptime_percentage = 0
@@ -245,10 +304,8 @@ class AgentHealthMonitor:
         
         latest_check = self.status_history[-1]
         
-        # Calculate system health trends
-        recent_checks = self.status_history[-10:] if len(self.status_history) >= 10 else self.status_history
-        
-        avg_healthy = sum(check["summary"]["healthy_agents"] for check in recent_checks) / len(recent_checks)
+        # Calculate system health trends from the rolling window
+        avg_healthy = self._recent_healthy_sum / len(self._recent_healthy)
         
         return {
             "current_status": latest_check["summary"],
@@ -275,7 +332,7 @@ class AgentHealthMonitor:
         }
         
         # Add individual agent statistics
-        for agent_name in AGENT_CONFIG.keys():
+        for agent_name in self._agent_names:
             report["agent_statistics"][agent_name] = self.get_agent_statistics(agent_name)
         
         return report
@@ -315,8 +372,12 @@ async def run_monitoring_demo():
         
         # Save report
         report_path = "deployment/agent_monitoring_report.json"
-        with open(report_path, 'w') as f:
-            json.dump(final_report, f, indent=2)
+        if HAS_ORJSON:
+            report_bytes = orjson.dumps(final_report)
+        else:
+            report_bytes = json.dumps(final_report, separators=(",", ":")).encode()
+        with open(report_path, 'wb', buffering=1 << 16) as f:
+            f.write(report_bytes)
         
         print(f"📄 Monitoring report saved to {report_path}")
         
@@ -46,53 +46,53 @@ class AgentverseRegistrationManager:
             "registration_timestamp": datetime.utcnow().isoformat()
         }
         
-        # Register each agent
-        for agent_name, agent_config in AGENT_CONFIG.items():
-            try:
-                self.logger.info(f"Registering {agent_name} agent...")
-                
-                # Load agent manifest
-                manifest = await self._load_agent_manifest(agent_name)
-                
-                # Register agent
-                registration_result = await self._register_agent(agent_name, manifest, agent_config)
-                
-                if registration_result["success"]:
-                    results["successful_registrations"].append({
-                        "agent_name": agent_name,
-                        "agent_id": registration_result["agent_id"],
-                        "agentverse_url": registration_result.get("agentverse_url"),
-                        "chat_protocol_enabled": True,
-                        "badges": self.badges
-                    })
-                    self.registered_agents[agent_name] = registration_result
-                    self.logger.info(f"Successfully registered {agent_name} agent")
-                else:
-                    results["failed_registrations"].append({
-                        "agent_name": agent_name,
-                        "error": registration_result["error"],
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-                    self.registration_errors.append(registration_result)
-                    self.logger.error(f"Failed to register {agent_name} agent: {registration_result['error']}")
-                
-                # Small delay between registrations
-                await asyncio.sleep(1)
-                
-            except Exception as e:
-                error_msg = f"Exception during {agent_name} registration: {str(e)}"
+        # Register all agents concurrently; each registration is I/O bound
+        agent_items = list(AGENT_CONFIG.items())
+        registration_results = await asyncio.gather(
+            *(self._register_one(agent_name, agent_config) for agent_name, agent_config in agent_items),
+            return_exceptions=True
+        )
+        
+        # Record outcomes in configuration order
+        for (agent_name, _), registration_result in zip(agent_items, registration_results):
+            if isinstance(registration_result, Exception):
+                error_msg = f"Exception during {agent_name} registration: {str(registration_result)}"
                 self.logger.error(error_msg)
                 results["failed_registrations"].append({
                     "agent_name": agent_name,
                     "error": error_msg,
                     "timestamp": datetime.utcnow().isoformat()
                 })
+            elif registration_result["success"]:
+                results["successful_registrations"].append({
+                    "agent_name": agent_name,
+                    "agent_id": registration_result["agent_id"],
+                    "agentverse_url": registration_result.get("agentverse_url"),
+                    "chat_protocol_enabled": True,
+                    "badges": self.badges
+                })
+                self.registered_agents[agent_name] = registration_result
+                self.logger.info(f"Successfully registered {agent_name} agent")
+            else:
+                results["failed_registrations"].append({
+                    "agent_name": agent_name,
+                    "error": registration_result["error"],
+                    "timestamp": datetime.utcnow().isoformat()
+                })
+                self.registration_errors.append(registration_result)
+                self.logger.error(f"Failed to register {agent_name} agent: {registration_result['error']}")
         
         # Generate registration report
         await self._generate_registration_report(results)
         
         return results
     
+    async def _register_one(self, agent_name: str, agent_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Load an agent's manifest and register it on Agentverse."""
+        self.logger.info(f"Registering {agent_name} agent...")
+        manifest = await self._load_agent_manifest(agent_name)
+        return await self._register_agent(agent_name, manifest, agent_config)
+    
     async def _load_agent_manifest(self, agent_name: str) -> Dict[str, Any]:
         """Load agent manifest from file."""
         manifest_path = f"agents/manifests/{agent_name}_manifest.json"
@@ -238,9 +238,11 @@ class AgentverseRegistrationManager:
             "monitoring_timestamp": datetime.utcnow().isoformat()
         }
         
-        for agent_name in AGENT_CONFIG.keys():
-            health_status = await self.check_agent_health(agent_name)
-            
+        health_statuses = await asyncio.gather(
+            *(self.check_agent_health(agent_name) for agent_name in AGENT_CONFIG)
+        )
+        
+        for health_status in health_statuses:
             if health_status["healthy"]:
                 monitoring_results["healthy_agents"].append(health_status)
             else:
@@ -263,13 +265,14 @@ class AgentverseRegistrationManager:
         }
         
         # Add discovery verification for successful registrations
-        results["discovery_verification"] = []
-        for agent_info in results["successful_registrations"]:
-            discovery_result = await self.verify_agent_discovery(agent_info["agent_name"])
-            results["discovery_verification"].append({
-                "agent_name": agent_info["agent_name"],
-                "discovery_result": discovery_result
-            })
+        agent_names = [agent_info["agent_name"] for agent_info in results["successful_registrations"]]
+        discovery_results = await asyncio.gather(
+            *(self.verify_agent_discovery(agent_name) for agent_name in agent_names)
+        )
+        results["discovery_verification"] = [
+            {"agent_name": agent_name, "discovery_result": discovery_result}
+            for agent_name, discovery_result in zip(agent_names, discovery_results)
+        ]
         
         # Save report
         os.makedirs(os.path.dirname(report_path), exist_ok=True)
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the HealthSync agent health monitor.
+Covers status tracking, summaries and alerts across mixed health check outcomes.
+"""
+
+import unittest
+import asyncio
+import sys
+import os
+from unittest.mock import patch
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from config import AGENT_CONFIG
+from deployment.agent_monitor import AgentHealthMonitor
+
+
+class TestAgentHealthMonitor(unittest.TestCase):
+    """Test agent status tracking over mixed healthy/failed checks."""
+
+    def setUp(self):
+        """Set up a monitor with a deterministic per-agent check outcome."""
+        self.monitor = AgentHealthMonitor(check_interval=5)
+        self.agent_names = list(AGENT_CONFIG)
+        self.healthy_agent, self.failing_agent, self.raising_agent = self.agent_names[:3]
+        self.outcomes = {name: "healthy" for name in self.agent_names}
+        self.outcomes[self.failing_agent] = "unhealthy"
+        self.outcomes[self.raising_agent] = "raise"
+        self.check_count = 0
+
+    async def _fake_check(self, agent_name, agent_config):
+        """Return the configured outcome for an agent, or raise."""
+        self.check_count += 1
+        outcome = self.outcomes[agent_name]
+        if outcome == "raise":
+            raise RuntimeError("probe crashed")
+        return {
+            "status": outcome,
+            "agent_name": agent_name,
+            "timestamp": f"2025-01-01T00:00:{self.check_count:02d}"
+        }
+
+    def _run(self, coroutine):
+        """Drive a coroutine on a private event loop."""
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coroutine)
+        finally:
+            loop.close()
+
+    def _run_cycles(self, cycles):
+        """Run several monitoring cycles and return the last result."""
+        with patch.object(self.monitor, "check_agent_health", side_effect=self._fake_check):
+            for _ in range(cycles):
+                results = self._run(self.monitor.check_all_agents())
+        return results
+
+    def test_raising_check_is_recorded_but_not_tracked(self):
+        """A check that raises is reported as an error without stopping the others."""
+        results = self._run_cycles(1)
+
+        self.assertEqual(set(results["agents"]), set(self.agent_names))
+        self.assertEqual(results["agents"][self.raising_agent]["status"], "error")
+        self.assertEqual(results["agents"][self.raising_agent]["error"], "probe crashed")
+        self.assertEqual(results["agents"][self.failing_agent]["status"], "unhealthy")
+        self.assertEqual(results["agents"][self.healthy_agent]["status"], "healthy")
+        self.assertNotIn(self.raising_agent, self.monitor.agent_status)
+
+    def test_failure_counts_after_mixed_checks(self):
+        """Per-agent counters track totals and consecutive failures."""
+        self._run_cycles(3)
+
+        status = self.monitor.agent_status
+        self.assertEqual(status[self.healthy_agent]["total_checks"], 3)
+        self.assertEqual(status[self.healthy_agent]["total_failures"], 0)
+        self.assertEqual(status[self.healthy_agent]["consecutive_failures"], 0)
+        self.assertIsNone(status[self.healthy_agent]["last_unhealthy"])
+        self.assertEqual(status[self.failing_agent]["total_checks"], 3)
+        self.assertEqual(status[self.failing_agent]["total_failures"], 3)
+        self.assertEqual(status[self.failing_agent]["consecutive_failures"], 3)
+        self.assertIsNone(status[self.failing_agent]["last_healthy"])
+
+        # Recovery resets the consecutive count but keeps the failure total
+        self.outcomes[self.failing_agent] = "healthy"
+        self._run_cycles(1)
+
+        stats = self.monitor.get_agent_statistics(self.failing_agent)
+        self.assertEqual(stats["total_checks"], 4)
+        self.assertEqual(stats["total_failures"], 3)
+        self.assertEqual(stats["consecutive_failures"], 0)
+        self.assertEqual(stats["uptime_percentage"], 25.0)
+        self.assertEqual(stats["status"], "healthy")
+        self.assertEqual(self.monitor.get_agent_statistics(self.raising_agent), {"error": "Agent not found"})
+
+    def test_summary_counts_mixed_results(self):
+        """Each status lands in its own summary bucket; raising checks are not counted."""
+        self.outcomes[self.agent_names[3]] = "degraded"
+        results = self._run_cycles(1)
+
+        self.assertEqual(results["summary"], {
+            "total_agents": len(AGENT_CONFIG),
+            "healthy_agents": len(self.agent_names) - 3,
+            "unhealthy_agents": 1,
+            "unknown_agents": 1
+        })
+
+    def test_rolling_healthy_average(self):
+        """The overview averages healthy agents over the last 10 cycles only."""
+        self._run_cycles(3)
+
+        healthy_count = len(self.agent_names) - 2
+        overview = self.monitor.get_system_overview()
+        self.assertEqual(overview["total_checks_performed"], 3)
+        self.assertEqual(overview["average_healthy_agents"], healthy_count)
+        self.assertEqual(overview["system_health_trend"], "degraded")
+
+        for name in self.agent_names:
+            self.outcomes[name] = "healthy"
+        self._run_cycles(5)
+        overview = self.monitor.get_system_overview()
+        self.assertEqual(overview["average_healthy_agents"],
+                         round((3 * healthy_count + 5 * len(self.agent_names)) / 8, 1))
+
+        self._run_cycles(5)
+        overview = self.monitor.get_system_overview()
+        self.assertEqual(overview["average_healthy_agents"], len(self.agent_names))
+        self.assertEqual(overview["system_health_trend"], "stable")
+
+    def test_consecutive_failure_alert(self):
+        """An alert fires once an agent reaches the consecutive failure threshold."""
+        self._run_cycles(2)
+        self.assertEqual(self._run(self.monitor.check_alerts()), [])
+
+        self._run_cycles(1)
+        alerts = self._run(self.monitor.check_alerts())
+        self.assertEqual([(a["type"], a["agent_name"]) for a in alerts],
+                         [("consecutive_failures", self.failing_agent)])
+
+    def test_high_error_rate_alert(self):
+        """Error rate alerts need more than 10 checks of data."""
+        self._run_cycles(10)
+        alert_types = {(a["type"], a["agent_name"]) for a in self._run(self.monitor.check_alerts())}
+        self.assertNotIn(("high_error_rate", self.failing_agent), alert_types)
+
+        self._run_cycles(1)
+        alert_types = {(a["type"], a["agent_name"]) for a in self._run(self.monitor.check_alerts())}
+        self.assertIn(("high_error_rate", self.failing_agent), alert_types)
+        self.assertNotIn(("high_error_rate", self.healthy_agent), alert_types)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent Agentverse registration of HealthSync agents.
+"""
+
+import unittest
+import asyncio
+import sys
+import os
+from unittest.mock import AsyncMock, patch
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from config import AGENT_CONFIG
+from deployment.agentverse_registration import AgentverseRegistrationManager
+
+
+class TestAgentverseRegistration(unittest.TestCase):
+    """Test registration outcomes when one agent fails."""
+
+    def setUp(self):
+        """Set up a manager with a stubbed manifest loader."""
+        self.manager = AgentverseRegistrationManager(api_key="test-key")
+        self.agent_names = list(AGENT_CONFIG)
+        self.raising_agent = self.agent_names[1]
+
+    async def _fake_manifest(self, agent_name):
+        """Return a valid manifest, or raise for the configured agent."""
+        if agent_name == self.raising_agent:
+            raise FileNotFoundError(f"Manifest file not found: {agent_name}")
+        return {
+            "name": agent_name,
+            "description": f"{agent_name} agent",
+            "version": "1.0.0",
+            "badges": ["Innovation Lab"],
+            "chat_protocol_enabled": True
+        }
+
+    def test_one_agent_raising_does_not_block_others(self):
+        """A raising registration is recorded as failed; the rest still register."""
+        with patch.object(self.manager, "_load_agent_manifest", side_effect=self._fake_manifest), \
+             patch.object(self.manager, "_generate_registration_report", new_callable=AsyncMock) as report, \
+             patch("deployment.agentverse_registration.asyncio.sleep", new_callable=AsyncMock):
+            loop = asyncio.new_event_loop()
+            try:
+                results = loop.run_until_complete(self.manager.register_all_agents())
+            finally:
+                loop.close()
+
+        expected_successes = [name for name in self.agent_names if name != self.raising_agent]
+        self.assertEqual(
+            [entry["agent_name"] for entry in results["successful_registrations"]],
+            expected_successes
+        )
+        self.assertEqual(len(results["failed_registrations"]), 1)
+        failure = results["failed_registrations"][0]
+        self.assertEqual(failure["agent_name"], self.raising_agent)
+        self.assertIn(f"Exception during {self.raising_agent} registration", failure["error"])
+        self.assertIn("Manifest file not found", failure["error"])
+
+        self.assertEqual(list(self.manager.registered_agents), expected_successes)
+        report.assert_awaited_once_with(results)
+
+
+if __name__ == "__main__":
+    unittest.main()